@@ -17,35 +17,36 @@ from .volcano_ble import VolcanoSensor
 
 PARALLEL_UPDATES = 0
 
-SENSOR_DESCRIPTIONS: dict[str, BinarySensorEntityDescription] = {
-    VolcanoSensor.AUTO_SHUTDOWN: BinarySensorEntityDescription(
+SENSOR_DESCRIPTIONS: tuple[BinarySensorEntityDescription, ...] = (
+    BinarySensorEntityDescription(
         key=VolcanoSensor.AUTO_SHUTDOWN,
         translation_key=VolcanoSensor.AUTO_SHUTDOWN,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-    VolcanoSensor.PRV1_ERROR: BinarySensorEntityDescription(
+    BinarySensorEntityDescription(
         key=VolcanoSensor.PRV1_ERROR,
         translation_key=VolcanoSensor.PRV1_ERROR,
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=BinarySensorDeviceClass.PROBLEM,
         entity_registry_enabled_default=False,
     ),
-    VolcanoSensor.PRV2_ERROR: BinarySensorEntityDescription(
+    BinarySensorEntityDescription(
         key=VolcanoSensor.PRV2_ERROR,
         translation_key=VolcanoSensor.PRV2_ERROR,
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=BinarySensorDeviceClass.PROBLEM,
         entity_registry_enabled_default=False,
     ),
-    VolcanoSensor.CONNECTED: BinarySensorEntityDescription(
-        key=VolcanoSensor.CONNECTED,
-        translation_key=VolcanoSensor.CONNECTED,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        entity_registry_enabled_default=True,
-    ),
-}
+)
+
+CONNECTED_DESCRIPTION = BinarySensorEntityDescription(
+    key=VolcanoSensor.CONNECTED,
+    translation_key=VolcanoSensor.CONNECTED,
+    entity_category=EntityCategory.DIAGNOSTIC,
+    device_class=BinarySensorDeviceClass.CONNECTIVITY,
+    entity_registry_enabled_default=True,
+)
 
 
 async def async_setup_entry(
@@ -57,14 +58,12 @@ async def async_setup_entry(
     coordinator = entry.runtime_data
     async_add_entities(
         [
-            VolcanoBinarySensorEntity(coordinator, VolcanoSensor.AUTO_SHUTDOWN),
-            VolcanoBinarySensorEntity(coordinator, VolcanoSensor.PRV1_ERROR),
-            VolcanoBinarySensorEntity(coordinator, VolcanoSensor.PRV2_ERROR),
+            *(
+                VolcanoBinarySensorEntity(coordinator, description)
+                for description in SENSOR_DESCRIPTIONS
+            ),
             VolcanoBinarySensorEntity(
-                coordinator,
-                VolcanoSensor.CONNECTED,
-                always_available=True,
-                initial_value=False,
+                coordinator, CONNECTED_DESCRIPTION, always_available=True
             ),
         ]
     )
@@ -76,18 +75,15 @@ class VolcanoBinarySensorEntity(VolcanoHybridEntity, BinarySensorEntity):
     def __init__(
         self,
         coordinator: VolcanoHybridCoordinator,
-        key: VolcanoSensor,
+        description: BinarySensorEntityDescription,
         *,
         always_available: bool = False,
-        initial_value: bool | None = None,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(
-            coordinator, SENSOR_DESCRIPTIONS[key], always_available=always_available
-        )
-        self._attr_is_on = initial_value
+        super().__init__(coordinator, description, always_available=always_available)
 
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_is_on = self.coordinator.data.get(self._key)
-        super()._handle_coordinator_update()
+    @property
+    def is_on(self) -> bool | None:
+        """Return the value straight from the device data."""
+        is_on: bool | None = self._get_value(self.coordinator.data)
+        return is_on
@@ -22,22 +22,21 @@ PARALLEL_UPDATES = 0
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
-SENSOR_DESCRIPTIONS: dict[str, ButtonEntityDescription] = {
-    VolcanoSensor.RECONNECT: ButtonEntityDescription(
-        key=VolcanoSensor.RECONNECT,
-        translation_key=VolcanoSensor.RECONNECT,
-        device_class=ButtonDeviceClass.RESTART,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_registry_enabled_default=False,
-    ),
-    VolcanoSensor.DELAYED_RECONNECT: ButtonEntityDescription(
-        key=VolcanoSensor.DELAYED_RECONNECT,
-        translation_key=VolcanoSensor.DELAYED_RECONNECT,
-        device_class=ButtonDeviceClass.RESTART,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_registry_enabled_default=False,
-    ),
-}
+RECONNECT_DESCRIPTION = ButtonEntityDescription(
+    key=VolcanoSensor.RECONNECT,
+    translation_key=VolcanoSensor.RECONNECT,
+    device_class=ButtonDeviceClass.RESTART,
+    entity_category=EntityCategory.DIAGNOSTIC,
+    entity_registry_enabled_default=False,
+)
+
+DELAYED_RECONNECT_DESCRIPTION = ButtonEntityDescription(
+    key=VolcanoSensor.DELAYED_RECONNECT,
+    translation_key=VolcanoSensor.DELAYED_RECONNECT,
+    device_class=ButtonDeviceClass.RESTART,
+    entity_category=EntityCategory.DIAGNOSTIC,
+    entity_registry_enabled_default=False,
+)
 
 
 async def async_setup_entry(
@@ -58,10 +57,10 @@ async def async_setup_entry(
 
     async_add_entities(
         [
-            VolcanoButtonEntity(coordinator, VolcanoSensor.RECONNECT, _async_reconnect),
+            VolcanoButtonEntity(coordinator, RECONNECT_DESCRIPTION, _async_reconnect),
             VolcanoButtonEntity(
                 coordinator,
-                VolcanoSensor.DELAYED_RECONNECT,
+                DELAYED_RECONNECT_DESCRIPTION,
                 _async_delayed_reconnect,
             ),
         ]
@@ -74,11 +73,11 @@ class VolcanoButtonEntity(VolcanoHybridEntity, ButtonEntity):
     def __init__(
         self,
         coordinator: VolcanoHybridCoordinator,
-        key: VolcanoSensor,
+        description: ButtonEntityDescription,
         async_callback: Callable[[], Awaitable[None]],
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator, SENSOR_DESCRIPTIONS[key], always_available=True)
+        super().__init__(coordinator, description, always_available=True)
         self._async_on_click_callback = async_callback
 
     async def async_press(self) -> None:
@@ -11,7 +11,7 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import VOLCANO_HYBRID_MAX_TEMP, VOLCANO_HYBRID_MIN_DISPLAY_TEMP
@@ -21,12 +21,10 @@ from .volcano_ble import VolcanoSensor
 
 PARALLEL_UPDATES = 0
 
-SENSOR_DESCRIPTIONS: dict[str, ClimateEntityDescription] = {
-    VolcanoSensor.VOLCANO: ClimateEntityDescription(
-        key=VolcanoSensor.VOLCANO,
-        name=None,
-    ),
-}
+CLIMATE_DESCRIPTION = ClimateEntityDescription(
+    key=VolcanoSensor.VOLCANO,
+    name=None,
+)
 
 
 async def async_setup_entry(
@@ -38,7 +36,7 @@ async def async_setup_entry(
     coordinator = config_entry.runtime_data
     async_add_entities(
         [
-            VolcanoHybridClimate(coordinator, VolcanoSensor.VOLCANO),
+            VolcanoHybridClimate(coordinator, CLIMATE_DESCRIPTION),
         ]
     )
 
@@ -58,17 +56,23 @@ class VolcanoHybridClimate(VolcanoHybridEntity, ClimateEntity):
         | ClimateEntityFeature.TURN_OFF
         | ClimateEntityFeature.TURN_ON
     )
-
-    def __init__(self, coordinator: VolcanoHybridCoordinator, key: str) -> None:
+    # Until the first update arrives
+    _attr_current_temperature = 0
+    _attr_target_temperature = VOLCANO_HYBRID_MIN_DISPLAY_TEMP
+    _attr_hvac_mode = HVACMode.OFF
+    _attr_fan_mode = "off"
+
+    def __init__(
+        self,
+        coordinator: VolcanoHybridCoordinator,
+        description: ClimateEntityDescription,
+    ) -> None:
         """Initialize the climate."""
-        super().__init__(coordinator, SENSOR_DESCRIPTIONS[key])
-        self._attr_current_temperature = 0
-        self._attr_target_temperature = 40
-        self._attr_hvac_mode = HVACMode.OFF
-        self._attr_fan_mode = "off"
-
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        super().__init__(coordinator, description)
+
+    @callback
+    def _async_update_attrs(self) -> bool:
+        """Update the entity attributes from the coordinator data."""
         self._attr_current_temperature = self.coordinator.data.current_temp
         self._attr_target_temperature = self.coordinator.data.set_temp_state
         self._attr_hvac_mode = (
@@ -76,7 +80,7 @@ class VolcanoHybridClimate(VolcanoHybridEntity, ClimateEntity):
         )
         self._attr_fan_mode = "on" if self.coordinator.data.fan_state else "off"
         self._attr_assumed_state = self.coordinator.data.is_assumed
-        super()._handle_coordinator_update()
+        return True
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set the target temperature."""
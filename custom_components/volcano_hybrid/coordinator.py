@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import zlib
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
@@ -36,6 +38,12 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# The poll only reconnects and replays unconfirmed writes, state is pushed.
+# While connected to a device that is off (and has nothing to replay) it can
+# back off, a device in use or a lost connection is polled at the fast rate.
+UPDATE_INTERVAL = timedelta(seconds=10)
+IDLE_UPDATE_INTERVAL = timedelta(minutes=1)
+
 type VolcanoHybridConfigEntry = ConfigEntry[VolcanoHybridCoordinator]
 
 
@@ -56,8 +64,8 @@ class VolcanoHybridCoordinator(DataUpdateCoordinator[VolcanoHybridData]):
             _LOGGER,
             name="Volcano Hybrid",
             config_entry=config_entry,
-            update_interval=timedelta(seconds=10),
-            always_update=True,
+            update_interval=UPDATE_INTERVAL,
+            always_update=False,
         )
 
         self.device_info = DeviceInfo(
@@ -67,15 +75,29 @@ class VolcanoHybridCoordinator(DataUpdateCoordinator[VolcanoHybridData]):
             model="Volcano Hybrid",
             connections={(CONNECTION_BLUETOOTH, address)},
         )
-        self._device = VolcanoBLE(self.async_update_listeners, self.update_device)
+        self._device = VolcanoBLE(
+            self._async_schedule_update_listeners, self.update_device
+        )
         self.data = self._device.data
         self.address = address
+        # Shared by every entity, which only appends its description key.
+        self.unique_id_prefix = f"{address}-"
         self._was_connected = False
         # Whether the integration may connect on its own. Disabling this frees
         # the device so other Bluetooth clients can use it; commands and the
         # manual reconnect buttons still connect on demand.
         self.auto_connect = True
         self._connect_timer: CALLBACK_TYPE | None = None
+        self._device_id: str | None = None
+        self._update_listeners_handle: asyncio.Handle | None = None
+        # Polls, scheduled connects and reconnects all refresh the device;
+        # one at a time, so they don't queue duplicate GATT operations.
+        self._refresh_lock = asyncio.Lock()
+        # Polls of several devices set up together would all hit the Bluetooth
+        # adapter at the same moment; give each device its own (stable) slot.
+        self._first_poll_stagger: timedelta | None = timedelta(
+            seconds=zlib.crc32(address.encode()) % UPDATE_INTERVAL.seconds
+        )
 
     @property
     def auto_connect_delay(self) -> float:
@@ -164,24 +186,61 @@ class VolcanoHybridCoordinator(DataUpdateCoordinator[VolcanoHybridData]):
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
+        # Stops the poll for good, an interval change cannot re-arm it
+        await super().async_shutdown()
         self._cancel_connect_timer()
         await self._device.async_disconnect()
+        # After the disconnect, which reports a final data update itself
+        if self._update_listeners_handle is not None:
+            self._update_listeners_handle.cancel()
+            self._update_listeners_handle = None
 
     async def _async_update_data(self) -> VolcanoHybridData:
         """Reconnect/refresh on the coordinator interval (a fallback poll)."""
-        await self._async_refresh_device(connect=self.auto_connect)
+        # A refresh already talking to the device covers this poll.
+        if not self._refresh_lock.locked():
+            await self._async_refresh_device(connect=self.auto_connect)
+        if self.last_update_success != self._device.is_connected:
+            # The poll returns the same data object and counts as a success,
+            # so it does not notify the listeners; publish availability here.
+            self._async_schedule_update_listeners()
         return self._device.data
 
     async def _async_refresh_device(self, *, connect: bool) -> None:
         """Refresh the device, optionally (re)connecting to it."""
-        device = bluetooth.async_ble_device_from_address(self.hass, self.address, True)
+        async with self._refresh_lock:
+            device = bluetooth.async_ble_device_from_address(
+                self.hass, self.address, True
+            )
+
+            last_info = bluetooth.async_last_service_info(self.hass, self.address)
+            if last_info:
+                # Through the setter, so a changed signal still reaches the
+                # entities now that unchanged polls skip the listener fan-out.
+                self._device.rssi = last_info.rssi
+
+            if device and (connect or self._device.is_connected):
+                await self._device.async_manual_update(device)
 
-        last_info = bluetooth.async_last_service_info(self.hass, self.address)
-        if last_info:
-            self._device.device_rssi = last_info.rssi
+    @callback
+    def _async_schedule_update_listeners(self) -> None:
+        """
+        Update the listeners on the next event loop iteration.
+
+        The device reports each characteristic separately, and a burst of
+        notifications (or the parsing of the initial read) lands in the same
+        iteration; they result in a single listener update.
+        """
+        if self._update_listeners_handle is None:
+            self._update_listeners_handle = self.hass.loop.call_soon(
+                self._async_flush_update_listeners
+            )
 
-        if device and (connect or self._device.is_connected):
-            await self._device.async_manual_update(device)
+    @callback
+    def _async_flush_update_listeners(self) -> None:
+        """Update the listeners for the coalesced device updates."""
+        self._update_listeners_handle = None
+        self.async_update_listeners()
 
     def async_update_listeners(self) -> None:
         """Update listeners."""
@@ -195,17 +254,52 @@ class VolcanoHybridCoordinator(DataUpdateCoordinator[VolcanoHybridData]):
                 )
             self._was_connected = connected
         self.last_update_success = connected
+        self._async_adjust_update_interval()
         super().async_update_listeners()
 
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll, offsetting the first one per device."""
+        stagger = self._first_poll_stagger
+        interval = self.update_interval
+        if stagger is None or interval is None:
+            super()._schedule_refresh()
+            return
+        self._first_poll_stagger = None
+        self.update_interval = interval + stagger
+        super()._schedule_refresh()
+        self.update_interval = interval
+
+    @callback
+    def _async_adjust_update_interval(self) -> None:
+        """Poll slowly while connected to an idle device, fast otherwise."""
+        idle = (
+            self._device.is_connected
+            and not self.data.is_on
+            and not self.data.is_assumed
+        )
+        interval = IDLE_UPDATE_INTERVAL if idle else UPDATE_INTERVAL
+        if interval == self.update_interval:
+            return
+        self.update_interval = interval
+        # Only reschedule when speeding up, so a pending idle poll does not
+        # delay the replay of a write the device has not confirmed yet.
+        if not idle and self._listeners:
+            self._schedule_refresh()
+
     def update_device(self) -> None:
         """Update the device registry with the latest data."""
         dev_reg = dr.async_get(self.hass)
-        device = dev_reg.async_get_device(self.device_info.get("identifiers"))
-        if not device:
-            return
+        # The registry entry outlives reconnects, resolve it by identifier only
+        # once (and again if it was removed in the meantime).
+        if self._device_id is None or dev_reg.async_get(self._device_id) is None:
+            device = dev_reg.async_get_device(self.device_info.get("identifiers"))
+            if not device:
+                return
+            self._device_id = device.id
 
         dev_reg.async_update_device(
-            device_id=device.id,
+            device_id=self._device_id,
             serial_number=self.data.serial_number,
             sw_version=self.data.firmware_version,
             hw_version=self.data.bootloader_version,
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import logging
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import VolcanoHybridCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .volcano_ble import VolcanoHybridData
+
+_LOGGER = logging.getLogger(__name__)
+
 
 class VolcanoHybridEntity(CoordinatorEntity[VolcanoHybridCoordinator]):
     """Base class for Volcano Hybrid entities."""
@@ -23,12 +35,50 @@ class VolcanoHybridEntity(CoordinatorEntity[VolcanoHybridCoordinator]):
         """Initialize the entity."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._key = description.key
-        self._attr_unique_id = f"{coordinator.address}-{description.key}"
+        # Resolved once; reading the value is then a single C-level call on
+        # the push path.
+        self._get_value: Callable[[VolcanoHybridData], Any] = attrgetter(
+            str(description.key)
+        )
+        self._attr_unique_id = coordinator.unique_id_prefix + description.key
         self._attr_device_info = coordinator.device_info
         self._always_available = always_available
+        self._attr_available = self._async_compute_available()
 
     @property
     def available(self) -> bool:
+        """Return the availability stored on the last coordinator update."""
+        return self._attr_available
+
+    @callback
+    def _async_compute_available(self) -> bool:
         """Determine if the entity is available."""
-        return self._always_available or super().available
+        return self._always_available or self.coordinator.last_update_success
+
+    async def async_added_to_hass(self) -> None:
+        """Pick up availability changes from before the listener was added."""
+        await super().async_added_to_hass()
+        self._attr_available = self._async_compute_available()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Handle updated data from the coordinator.
+
+        The state is only written when the attributes or the availability
+        changed. Errors are logged rather than raised, so one failing entity
+        cannot abort the listener fan-out and leave the other entities stale.
+        """
+        try:
+            changed = self._async_update_attrs()
+            available = self._async_compute_available()
+            if changed or available != self._attr_available:
+                self._attr_available = available
+                super()._handle_coordinator_update()
+        except Exception:
+            _LOGGER.exception("Error handling an update for %s", self.entity_id)
+
+    @callback
+    def _async_update_attrs(self) -> bool:
+        """Update the entity attributes, returning whether they may have changed."""
+        return True
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.components.number import (
     NumberDeviceClass,
     NumberEntity,
@@ -18,8 +20,11 @@ from .volcano_ble import VolcanoSensor
 
 PARALLEL_UPDATES = 0
 
-SENSOR_DESCRIPTIONS: dict[str, NumberEntityDescription] = {
-    VolcanoSensor.SHUT_OFF: NumberEntityDescription(
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+SENSOR_DESCRIPTIONS: tuple[NumberEntityDescription, ...] = (
+    NumberEntityDescription(
         key=VolcanoSensor.SHUT_OFF,
         translation_key=VolcanoSensor.SHUT_OFF,
         device_class=NumberDeviceClass.DURATION,
@@ -31,7 +36,7 @@ SENSOR_DESCRIPTIONS: dict[str, NumberEntityDescription] = {
         native_unit_of_measurement=UnitOfTime.MINUTES,
         entity_registry_enabled_default=False,
     ),
-    VolcanoSensor.LED_BRIGHTNESS: NumberEntityDescription(
+    NumberEntityDescription(
         key=VolcanoSensor.LED_BRIGHTNESS,
         translation_key=VolcanoSensor.LED_BRIGHTNESS,
         entity_category=EntityCategory.CONFIG,
@@ -42,6 +47,11 @@ SENSOR_DESCRIPTIONS: dict[str, NumberEntityDescription] = {
         native_unit_of_measurement=PERCENTAGE,
         entity_registry_enabled_default=False,
     ),
+)
+
+SETTERS: dict[str, Callable[[VolcanoHybridCoordinator, float], Awaitable[None]]] = {
+    VolcanoSensor.SHUT_OFF: VolcanoHybridCoordinator.set_shut_off,
+    VolcanoSensor.LED_BRIGHTNESS: VolcanoHybridCoordinator.set_led_brightness,
 }
 
 
@@ -54,10 +64,8 @@ async def async_setup_entry(
     coordinator = entry.runtime_data
 
     async_add_entities(
-        [
-            VolcanoNumberEntity(coordinator, VolcanoSensor.SHUT_OFF),
-            VolcanoNumberEntity(coordinator, VolcanoSensor.LED_BRIGHTNESS),
-        ]
+        VolcanoNumberEntity(coordinator, description)
+        for description in SENSOR_DESCRIPTIONS
     )
 
 
@@ -65,16 +73,20 @@ class VolcanoNumberEntity(VolcanoHybridEntity, NumberEntity):
     """Representation of a Volcano number."""
 
     def __init__(
-        self, coordinator: VolcanoHybridCoordinator, key: VolcanoSensor
+        self,
+        coordinator: VolcanoHybridCoordinator,
+        description: NumberEntityDescription,
     ) -> None:
         """Initialize the number."""
-        super().__init__(coordinator, SENSOR_DESCRIPTIONS[key])
+        super().__init__(coordinator, description)
+        self._setter = SETTERS[description.key]
 
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_native_value = self.coordinator.data.get(self._key)
-        super()._handle_coordinator_update()
+    @property
+    def native_value(self) -> float | None:
+        """Return the value straight from the device data."""
+        value: float | None = self._get_value(self.coordinator.data)
+        return value
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await getattr(self.coordinator, "set_" + self._key)(value)
+        await self._setter(self.coordinator, value)
@@ -13,7 +13,7 @@ from homeassistant.const import (
     EntityCategory,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import VolcanoHybridConfigEntry, VolcanoHybridCoordinator
@@ -22,15 +22,15 @@ from .volcano_ble import VolcanoSensor
 
 PARALLEL_UPDATES = 0
 
-SENSOR_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
-    VolcanoSensor.CURRENT_AUTO_OFF_TIME: SensorEntityDescription(
+SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
         key=VolcanoSensor.CURRENT_AUTO_OFF_TIME,
         translation_key=VolcanoSensor.CURRENT_AUTO_OFF_TIME,
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTime.MINUTES,
     ),
-    VolcanoSensor.CURRENT_ON_TIME: SensorEntityDescription(
+    SensorEntityDescription(
         key=VolcanoSensor.CURRENT_ON_TIME,
         translation_key=VolcanoSensor.CURRENT_ON_TIME,
         device_class=SensorDeviceClass.DURATION,
@@ -38,7 +38,7 @@ SENSOR_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
         native_unit_of_measurement=UnitOfTime.MINUTES,
         entity_registry_enabled_default=False,
     ),
-    VolcanoSensor.HEAT_TIME: SensorEntityDescription(
+    SensorEntityDescription(
         key=VolcanoSensor.HEAT_TIME,
         translation_key=VolcanoSensor.HEAT_TIME,
         device_class=SensorDeviceClass.DURATION,
@@ -48,7 +48,11 @@ SENSOR_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-    VolcanoSensor.RSSI: SensorEntityDescription(
+)
+
+# Connection diagnostics, available even while the device is disconnected.
+CONNECTION_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
         key=VolcanoSensor.RSSI,
         translation_key=VolcanoSensor.RSSI,
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
@@ -57,13 +61,13 @@ SENSOR_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
         entity_registry_enabled_default=False,
     ),
-    VolcanoSensor.CONNECTED_ADDR: SensorEntityDescription(
+    SensorEntityDescription(
         key=VolcanoSensor.CONNECTED_ADDR,
         translation_key=VolcanoSensor.CONNECTED_ADDR,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-}
+)
 
 
 async def async_setup_entry(
@@ -76,12 +80,13 @@ async def async_setup_entry(
 
     async_add_entities(
         [
-            VolcanoSensorEntity(coordinator, VolcanoSensor.CURRENT_AUTO_OFF_TIME),
-            VolcanoSensorEntity(coordinator, VolcanoSensor.CURRENT_ON_TIME),
-            VolcanoSensorEntity(coordinator, VolcanoSensor.HEAT_TIME),
-            VolcanoSensorEntity(coordinator, VolcanoSensor.RSSI, always_available=True),
-            VolcanoSensorEntity(
-                coordinator, VolcanoSensor.CONNECTED_ADDR, always_available=True
+            *(
+                VolcanoSensorEntity(coordinator, description)
+                for description in SENSOR_DESCRIPTIONS
+            ),
+            *(
+                VolcanoSensorEntity(coordinator, description, always_available=True)
+                for description in CONNECTION_DESCRIPTIONS
             ),
         ]
     )
@@ -93,16 +98,18 @@ class VolcanoSensorEntity(VolcanoHybridEntity, SensorEntity):
     def __init__(
         self,
         coordinator: VolcanoHybridCoordinator,
-        key: VolcanoSensor,
+        description: SensorEntityDescription,
         *,
         always_available: bool = False,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(
-            coordinator, SENSOR_DESCRIPTIONS[key], always_available=always_available
-        )
+        super().__init__(coordinator, description, always_available=always_available)
 
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_native_value = self.coordinator.data.get(self._key)
-        super()._handle_coordinator_update()
+    @callback
+    def _async_update_attrs(self) -> bool:
+        """Update the value, returning whether it changed."""
+        value = self._get_value(self.coordinator.data)
+        if value == self._attr_native_value:
+            return False
+        self._attr_native_value = value
+        return True
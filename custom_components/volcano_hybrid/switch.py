@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import (
     SwitchDeviceClass,
@@ -10,7 +10,7 @@ from homeassistant.components.switch import (
     SwitchEntityDescription,
 )
 from homeassistant.const import STATE_ON, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
@@ -20,6 +20,9 @@ from .volcano_ble import VolcanoSensor
 
 PARALLEL_UPDATES = 0
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 AUTO_CONNECT_DESCRIPTION = SwitchEntityDescription(
     key=VolcanoSensor.AUTO_CONNECT,
     translation_key=VolcanoSensor.AUTO_CONNECT,
@@ -27,28 +30,34 @@ AUTO_CONNECT_DESCRIPTION = SwitchEntityDescription(
     entity_category=EntityCategory.CONFIG,
 )
 
-SENSOR_DESCRIPTIONS: dict[str, SwitchEntityDescription] = {
-    VolcanoSensor.SHOWING_CELSIUS: SwitchEntityDescription(
+SENSOR_DESCRIPTIONS: tuple[SwitchEntityDescription, ...] = (
+    SwitchEntityDescription(
         key=VolcanoSensor.SHOWING_CELSIUS,
         translation_key=VolcanoSensor.SHOWING_CELSIUS,
         device_class=SwitchDeviceClass.SWITCH,
         entity_category=EntityCategory.CONFIG,
         entity_registry_enabled_default=False,
     ),
-    VolcanoSensor.DISPLAY_ON_COOLING: SwitchEntityDescription(
+    SwitchEntityDescription(
         key=VolcanoSensor.DISPLAY_ON_COOLING,
         translation_key=VolcanoSensor.DISPLAY_ON_COOLING,
         device_class=SwitchDeviceClass.SWITCH,
         entity_category=EntityCategory.CONFIG,
         entity_registry_enabled_default=False,
     ),
-    VolcanoSensor.VIBRATION: SwitchEntityDescription(
+    SwitchEntityDescription(
         key=VolcanoSensor.VIBRATION,
         translation_key=VolcanoSensor.VIBRATION,
         device_class=SwitchDeviceClass.SWITCH,
         entity_category=EntityCategory.CONFIG,
         entity_registry_enabled_default=False,
     ),
+)
+
+SETTERS: dict[str, Callable[[VolcanoHybridCoordinator, bool], Awaitable[None]]] = {
+    VolcanoSensor.SHOWING_CELSIUS: VolcanoHybridCoordinator.set_showing_celsius,
+    VolcanoSensor.DISPLAY_ON_COOLING: VolcanoHybridCoordinator.set_display_on_cooling,
+    VolcanoSensor.VIBRATION: VolcanoHybridCoordinator.set_vibration,
 }
 
 
@@ -61,9 +70,10 @@ async def async_setup_entry(
     coordinator = entry.runtime_data
     async_add_entities(
         [
-            VolcanoSwitchEntity(coordinator, VolcanoSensor.SHOWING_CELSIUS),
-            VolcanoSwitchEntity(coordinator, VolcanoSensor.DISPLAY_ON_COOLING),
-            VolcanoSwitchEntity(coordinator, VolcanoSensor.VIBRATION),
+            *(
+                VolcanoSwitchEntity(coordinator, description)
+                for description in SENSOR_DESCRIPTIONS
+            ),
             VolcanoAutoConnectSwitch(coordinator),
         ]
     )
@@ -73,23 +83,30 @@ class VolcanoSwitchEntity(VolcanoHybridEntity, SwitchEntity):
     """Representation of a Volcano switch."""
 
     def __init__(
-        self, coordinator: VolcanoHybridCoordinator, key: VolcanoSensor
+        self,
+        coordinator: VolcanoHybridCoordinator,
+        description: SwitchEntityDescription,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator, SENSOR_DESCRIPTIONS[key])
-
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_is_on = self.coordinator.data.get(self._key)
-        super()._handle_coordinator_update()
+        super().__init__(coordinator, description)
+        self._setter = SETTERS[description.key]
+
+    @callback
+    def _async_update_attrs(self) -> bool:
+        """Update the state, returning whether it changed."""
+        is_on = self._get_value(self.coordinator.data)
+        if is_on == self._attr_is_on:
+            return False
+        self._attr_is_on = is_on
+        return True
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        await getattr(self.coordinator, "set_" + self._key)(True)
+        await self._setter(self.coordinator, True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        await getattr(self.coordinator, "set_" + self._key)(False)
+        await self._setter(self.coordinator, False)
 
 
 class VolcanoAutoConnectSwitch(VolcanoHybridEntity, SwitchEntity, RestoreEntity):
@@ -109,10 +126,13 @@ class VolcanoAutoConnectSwitch(VolcanoHybridEntity, SwitchEntity, RestoreEntity)
         )
         self._attr_is_on = self.coordinator.auto_connect
 
-    def _handle_coordinator_update(self) -> None:
+    @callback
+    def _async_update_attrs(self) -> bool:
         """Reflect the coordinator's auto-connect state."""
+        if self.coordinator.auto_connect == self._attr_is_on:
+            return False
         self._attr_is_on = self.coordinator.auto_connect
-        super()._handle_coordinator_update()
+        return True
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable automatic connecting."""
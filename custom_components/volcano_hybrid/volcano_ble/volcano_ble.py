@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
 import logging
-from typing import TYPE_CHECKING
+import struct
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from bleak import BleakClient, BleakError, BleakGATTCharacteristic, BLEDevice
 from bleak_retry_connector import (
@@ -18,7 +19,7 @@ from habluetooth import BluetoothServiceInfoBleak
 from .volcano_hybrid_data import VolcanoHybridData, VolcanoHybridDataStatusProvider
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Callable
 
 _LOGGER = logging.getLogger(__name__)
 STORZ_BICKEL_MANUFACTURER_ID = 1736
@@ -51,6 +52,52 @@ CHARACTERISTIC_FIRMWARE = "10100003-5354-4f52-5a26-4249434b454c"  # 3
 CHARACTERISTIC_HIST1 = "10100015-5354-4f52-5a26-4249434b454c"  # 3
 CHARACTERISTIC_HIST2 = "10100016-5354-4f52-5a26-4249434b454c"  # 3
 
+# Service of each characteristic, resolved when the characteristic is first used
+CHARACTERISTIC_SERVICES = {
+    **dict.fromkeys(
+        (
+            CHARACTERISTIC_CURRENT_TEMP,
+            CHARACTERISTIC_SET_TEMP,
+            CHARACTERISTIC_FAN_ON,
+            CHARACTERISTIC_FAN_OFF,
+            CHARACTERISTIC_HEATER_ON,
+            CHARACTERISTIC_HEATER_OFF,
+            CHARACTERISTIC_CURRENT_AUTO_OFF_TIME,
+            CHARACTERISTIC_HEAT_HOURS_CHANGED,
+            CHARACTERISTIC_HEAT_MINUTES_CHANGED,
+            CHARACTERISTIC_SHUT_OFF,
+            CHARACTERISTIC_LED_BRIGHTNESS,
+        ),
+        SERVICE_UUID,
+    ),
+    **dict.fromkeys(
+        (
+            CHARACTERISTIC_PRJ1V,
+            CHARACTERISTIC_PRJ2V,
+            CHARACTERISTIC_PRJ3V,
+            CHARACTERISTIC_SERIAL_NUMBER,
+            CHARACTERISTIC_FIRMWARE_VERSION,
+            CHARACTERISTIC_FIRMWARE_BLE_VERSION,
+            CHARACTERISTIC_BOOTLOADER_VERSION,
+            CHARACTERISTIC_FIRMWARE,
+            CHARACTERISTIC_HIST1,
+            CHARACTERISTIC_HIST2,
+        ),
+        SERVICE3_UUID,
+    ),
+}
+
+# Commands whose result is reported on a status characteristic instead
+STATUS_CHARACTERISTICS = dict.fromkeys(
+    (
+        CHARACTERISTIC_FAN_ON,
+        CHARACTERISTIC_FAN_OFF,
+        CHARACTERISTIC_HEATER_ON,
+        CHARACTERISTIC_HEATER_OFF,
+    ),
+    CHARACTERISTIC_PRJ1V,
+)
+
 MASK_PRJSTAT1_VOLCANO_HEIZUNG_ENA = 32
 MASK_PRJSTAT1_VOLCANO_ENABLE_AUTOBLESHUTDOWN = 512
 MASK_PRJSTAT1_VOLCANO_PUMPE_FET_ENABLE = 8192
@@ -60,6 +107,90 @@ MASK_PRJSTAT2_VOLCANO_DISPLAY_ON_COOLING = 4096
 MASK_PRJSTAT2_VOLCANO_ERR = 59
 MASK_PRJSTAT3_VOLCANO_VIBRATION = 1024
 
+# (data attribute, mask, set when the bit is clear) per status register
+PRJ1V_BITS = (
+    ("heater", MASK_PRJSTAT1_VOLCANO_HEIZUNG_ENA, False),
+    ("fan", MASK_PRJSTAT1_VOLCANO_PUMPE_FET_ENABLE, False),
+    ("auto_shutdown", MASK_PRJSTAT1_VOLCANO_ENABLE_AUTOBLESHUTDOWN, False),
+    ("prv1_error", MASK_PRJSTAT1_VOLCANO_ERR, False),
+)
+PRJ2V_BITS = (
+    ("showing_celsius", MASK_PRJSTAT2_VOLCANO_FAHRENHEIT_ENA, True),
+    ("display_on_cooling", MASK_PRJSTAT2_VOLCANO_DISPLAY_ON_COOLING, True),
+    ("prv2_error", MASK_PRJSTAT2_VOLCANO_ERR, False),
+)
+PRJ3V_BITS = (("vibration", MASK_PRJSTAT3_VOLCANO_VIBRATION, True),)
+
+# Temperatures and status registers are decoded on every notification; their
+# values (and every status mask) fit the low 16 bits.
+U16 = struct.Struct("<H")
+U32 = struct.Struct("<I")
+PAYLOAD_ON = b"\x01"
+PAYLOAD_OFF = b"\x00"
+
+
+def _toggle_payloads(mask: int) -> tuple[bytes, bytes]:
+    """Return the (off, on) register payloads of a settings toggle."""
+    return U32.pack(65536 + mask), U32.pack(mask)
+
+
+# Indexed by the requested state
+SHOWING_CELSIUS_PAYLOADS = _toggle_payloads(MASK_PRJSTAT2_VOLCANO_FAHRENHEIT_ENA)
+DISPLAY_ON_COOLING_PAYLOADS = _toggle_payloads(MASK_PRJSTAT2_VOLCANO_DISPLAY_ON_COOLING)
+VIBRATION_PAYLOADS = _toggle_payloads(MASK_PRJSTAT3_VOLCANO_VIBRATION)
+
+
+def _decode_int(data: bytearray) -> int:
+    return int.from_bytes(data, "little")
+
+
+def _decode_u16(data: bytearray) -> int:
+    # A shorter payload than expected still decodes instead of raising
+    if len(data) < U16.size:
+        return int.from_bytes(data, "little")
+    value: int = U16.unpack_from(data)[0]
+    return value
+
+
+def _decode_tenths(data: bytearray) -> int:
+    return _decode_u16(data) // 10
+
+
+def _decode_minutes(data: bytearray) -> int:
+    return int.from_bytes(data, "little") // 60
+
+
+def _decode_str(data: bytearray) -> str:
+    return data.decode("utf-8").strip()
+
+
+# (characteristic, data attribute, decoder) of the plain fields
+type CharacteristicField = tuple[str, str, Callable[[bytearray], Any]]
+
+SET_TEMP_FIELD: CharacteristicField = (
+    CHARACTERISTIC_SET_TEMP,
+    "set_temp",
+    _decode_tenths,
+)
+STATE_FIELDS: tuple[CharacteristicField, ...] = (
+    (CHARACTERISTIC_CURRENT_TEMP, "current_temp", _decode_tenths),
+    SET_TEMP_FIELD,
+    (CHARACTERISTIC_HEAT_HOURS_CHANGED, "heat_hours_changed", _decode_int),
+    (CHARACTERISTIC_HEAT_MINUTES_CHANGED, "heat_minutes_changed", _decode_int),
+)
+SETTING_FIELDS: tuple[CharacteristicField, ...] = (
+    (CHARACTERISTIC_SHUT_OFF, "shut_off", _decode_minutes),
+    (CHARACTERISTIC_LED_BRIGHTNESS, "led_brightness", _decode_int),
+)
+# The device identifiers never change, so reconnects skip them once known
+IDENTIFIER_FIELDS: tuple[CharacteristicField, ...] = (
+    (CHARACTERISTIC_SERIAL_NUMBER, "serial_number", _decode_str),
+    (CHARACTERISTIC_FIRMWARE_VERSION, "firmware_version", _decode_str),
+    (CHARACTERISTIC_FIRMWARE_BLE_VERSION, "firmware_ble_version", _decode_str),
+    (CHARACTERISTIC_BOOTLOADER_VERSION, "bootloader_version", _decode_str),
+    (CHARACTERISTIC_FIRMWARE, "firmware", _decode_str),
+)
+
 
 class VolcanoBLE(VolcanoHybridDataStatusProvider):
     """Volcano BLE class."""
@@ -81,6 +212,16 @@ class VolcanoBLE(VolcanoHybridDataStatusProvider):
         # leaking connection slots until Home Assistant restarts.
         self._connect_lock = asyncio.Lock()
         self.client: BleakClient | None = None
+        # Pending writes replayed on an auto-off notification, and held while
+        # an update replays them, so the two never send the same write twice
+        self._ensure_written_task: asyncio.Task[None] | None = None
+        self._ensure_written_lock = asyncio.Lock()
+        # Characteristics resolved on the current client, by uuid
+        self._characteristics: dict[str, BleakGATTCharacteristic] = {}
+        # Last payload applied per characteristic, to drop repeated notifications
+        self._last_values: dict[str, bytearray] = {}
+        # Characteristics followed through notifications on the current client
+        self._subscribed: set[str] = set()
         self.device = device
         self.data = VolcanoHybridData(self)
         self.device_rssi: int | None = None
@@ -133,7 +274,12 @@ class VolcanoBLE(VolcanoHybridDataStatusProvider):
 
         # This will update when not connected yet
         await self._ensure_client_connected()
-        await self._async_try_ensure_written_values()
+        if (task := self._ensure_written_task) is not None and not task.done():
+            # A notification is already replaying the pending writes
+            await asyncio.wait((task,))
+        else:
+            async with self._ensure_written_lock:
+                await self._async_try_ensure_written_values()
         return self.data
 
     async def _ensure_client_connected(self) -> bool:
@@ -167,6 +313,9 @@ class VolcanoBLE(VolcanoHybridDataStatusProvider):
                 await self.async_disconnect()
                 return False
 
+            self._characteristics.clear()
+            self._last_values.clear()
+            self._subscribed.clear()
             self._after_data_updated()
             try:
                 await self._async_read_and_subscribe_all()
@@ -193,6 +342,10 @@ class VolcanoBLE(VolcanoHybridDataStatusProvider):
         """Handle disconnection events."""
         _LOGGER.debug("Disconnected from BLE device at %s", client.address)
         self.client = None
+        self._characteristics.clear()
+        self._last_values.clear()
+        self._subscribed.clear()
+        self._cancel_ensure_written_values()
         self._after_data_updated()
 
     async def _async_read_and_subscribe_all(self) -> VolcanoHybridData:
@@ -203,163 +356,127 @@ class VolcanoBLE(VolcanoHybridDataStatusProvider):
             _LOGGER.exception("Error reading characteristics")
         return self.data
 
-    async def _async_read_set_temp(self, *, subscribe: bool = False) -> None:
-        def _read_set_temp_inner(data: bytearray) -> None:
-            self.data.set_temp = int(int.from_bytes(data, "little") / 10)
-
+    async def _async_read_field(
+        self, field: CharacteristicField, *, subscribe: bool = False
+    ) -> None:
+        """Read a plain field into the data, optionally following its changes."""
+        characteristic, attr, decode = field
         await self._async_read_and_subscribe(
-            SERVICE_UUID,
-            CHARACTERISTIC_SET_TEMP,
-            _read_set_temp_inner,
+            characteristic,
+            partial(self._store_field, attr, decode),
             subscribe=subscribe,
         )
 
-    async def _async_read_prj1v(self, *, subscribe: bool = False) -> None:
-        def _read_prj1v_inner(data: bytearray) -> None:
-            prj1v = int.from_bytes(data, "little")
-            self.data.heater = bool(prj1v & MASK_PRJSTAT1_VOLCANO_HEIZUNG_ENA)
-            self.data.fan = bool(prj1v & MASK_PRJSTAT1_VOLCANO_PUMPE_FET_ENABLE)
-            self.data.auto_shutdown = bool(
-                prj1v & MASK_PRJSTAT1_VOLCANO_ENABLE_AUTOBLESHUTDOWN
-            )
-            self.data.prv1_error = bool(prj1v & MASK_PRJSTAT1_VOLCANO_ERR)
-
-        await self._async_read_and_subscribe(
-            SERVICE3_UUID,
-            CHARACTERISTIC_PRJ1V,
-            _read_prj1v_inner,
-            subscribe=subscribe,
-        )
+    def _store_field(
+        self, attr: str, decode: Callable[[bytearray], Any], data: bytearray
+    ) -> None:
+        setattr(self.data, attr, decode(data))
 
-    async def _async_read_initial_characteristics(self) -> None:
-        def _read_current_temp(data: bytearray) -> None:
-            self.data.current_temp = int(int.from_bytes(data, "little") / 10)
+    async def _async_read_set_temp(self, *, subscribe: bool = False) -> None:
+        await self._async_read_field(SET_TEMP_FIELD, subscribe=subscribe)
 
-        def _parse_prj2v(data: bytearray) -> None:
-            prj2v = int.from_bytes(data, "little")
-            self.data.showing_celsius = bool(
-                prj2v & MASK_PRJSTAT2_VOLCANO_FAHRENHEIT_ENA == 0
-            )
-            self.data.display_on_cooling = bool(
-                prj2v & MASK_PRJSTAT2_VOLCANO_DISPLAY_ON_COOLING == 0
-            )
-            self.data.prv2_error = bool(prj2v & MASK_PRJSTAT2_VOLCANO_ERR)
+    def _apply_status_bits(
+        self, data: bytearray, bits: tuple[tuple[str, int, bool], ...]
+    ) -> None:
+        """Apply a status register value to the data using its bit table."""
+        value = _decode_u16(data)
+        for attr, mask, inverted in bits:
+            setattr(self.data, attr, bool(value & mask) != inverted)
 
-        def _parse_prj3v(data: bytearray) -> None:
-            prj3v = int.from_bytes(data, "little")
-            self.data.vibration = bool(prj3v & MASK_PRJSTAT3_VOLCANO_VIBRATION == 0)
+    def _parse_prj1v(self, data: bytearray) -> None:
+        """Parse status register 1."""
+        self._apply_status_bits(data, PRJ1V_BITS)
 
-        def _parse_serial_number(data: bytearray) -> None:
-            self.data.serial_number = data.decode("utf-8").strip()
+    def _parse_prj2v(self, data: bytearray) -> None:
+        """Parse status register 2."""
+        self._apply_status_bits(data, PRJ2V_BITS)
 
-        def _parse_firmware_version(data: bytearray) -> None:
-            self.data.firmware_version = data.decode("utf-8").strip()
+    def _parse_prj3v(self, data: bytearray) -> None:
+        """Parse status register 3."""
+        self._apply_status_bits(data, PRJ3V_BITS)
 
-        def _parse_firmware_ble_version(data: bytearray) -> None:
-            self.data.firmware_ble_version = data.decode("utf-8").strip()
+    async def _async_read_prj1v(self, *, subscribe: bool = False) -> None:
+        await self._async_read_and_subscribe(
+            CHARACTERISTIC_PRJ1V, self._parse_prj1v, subscribe=subscribe
+        )
 
-        def _parse_bootloader_version(data: bytearray) -> None:
-            self.data.bootloader_version = data.decode("utf-8").strip()
+    def _parse_current_auto_off_time(self, data: bytearray) -> None:
+        # The device reports 0 while it is off
+        minutes = int.from_bytes(data, "little") / 60
+        self.data.current_auto_off_time = minutes if minutes > 0 else None
+        if self.data.is_assumed:
+            # Replay outside the notification handler, it waits on the device
+            self._schedule_ensure_written_values()
+
+    def _schedule_ensure_written_values(self) -> None:
+        """Replay the pending writes in a task, unless a replay is running."""
+        if self._ensure_written_lock.locked() or (
+            self._ensure_written_task is not None
+            and not self._ensure_written_task.done()
+        ):
+            return
+        self._ensure_written_task = asyncio.create_task(
+            self._async_replay_written_values()
+        )
 
-        def _parse_firmware(data: bytearray) -> None:
-            self.data.firmware = data.decode("utf-8").strip()
+    def _cancel_ensure_written_values(self) -> None:
+        """Stop replaying pending writes, so the replay cannot reconnect."""
+        task = self._ensure_written_task
+        self._ensure_written_task = None
+        # The replay itself disconnects when reconnecting fails
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
 
-        async def _parse_current_auto_off_time(data: bytearray) -> None:
-            self.data.current_auto_off_time = int.from_bytes(data, "little") / 60
+    async def _async_replay_written_values(self) -> None:
+        try:
             await self._async_try_ensure_written_values()
+        except BleakError:
+            _LOGGER.debug("Error replaying pending writes", exc_info=True)
 
-        def _parse_heat_hours_changed(data: bytearray) -> None:
-            self.data.heat_hours_changed = int.from_bytes(data, "little")
-
-        def _parse_heat_minutes_changed(data: bytearray) -> None:
-            self.data.heat_minutes_changed = int.from_bytes(data, "little")
-
-        def _parse_shut_off(data: bytearray) -> None:
-            self.data.shut_off = int(int.from_bytes(data, "little") / 60)
-
-        def _parse_led_brightness(data: bytearray) -> None:
-            self.data.led_brightness = int.from_bytes(data, "little")
-
-        async def _async_read_set_temp_and_subscribe() -> None:
-            await self._async_read_set_temp(subscribe=True)
-
-        await self._async_read_prj1v(subscribe=True)  # Ensure on-state is correct
-        await asyncio.gather(
-            self._async_read_and_subscribe(
-                SERVICE_UUID,
-                CHARACTERISTIC_CURRENT_TEMP,
-                _read_current_temp,
-                subscribe=True,
-            ),
-            _async_read_set_temp_and_subscribe(),
-            self._async_read_and_subscribe(
-                SERVICE3_UUID,
-                CHARACTERISTIC_SERIAL_NUMBER,
-                _parse_serial_number,
-                subscribe=False,
-            ),
-            self._async_read_and_subscribe(
-                SERVICE3_UUID,
-                CHARACTERISTIC_FIRMWARE_VERSION,
-                _parse_firmware_version,
-                subscribe=False,
-            ),
-            self._async_read_and_subscribe(
-                SERVICE3_UUID,
-                CHARACTERISTIC_FIRMWARE_BLE_VERSION,
-                _parse_firmware_ble_version,
-                subscribe=False,
-            ),
-            self._async_read_and_subscribe(
-                SERVICE3_UUID,
-                CHARACTERISTIC_BOOTLOADER_VERSION,
-                _parse_bootloader_version,
-                subscribe=False,
-            ),
-            self._async_read_and_subscribe(
-                SERVICE3_UUID, CHARACTERISTIC_FIRMWARE, _parse_firmware, subscribe=False
-            ),
+    async def _async_read_initial_characteristics(self) -> None:
+        # Subscribe to the live state first so it is published while the
+        # settings and device identifiers are still being read. Replaying
+        # pending writes reads prj1v itself, so it needs no head start.
+        results = await asyncio.gather(
+            self._async_read_prj1v(subscribe=True),
+            *(self._async_read_field(field, subscribe=True) for field in STATE_FIELDS),
             self._async_read_and_subscribe(
-                SERVICE3_UUID, CHARACTERISTIC_PRJ2V, _parse_prj2v, subscribe=True
+                CHARACTERISTIC_PRJ2V, self._parse_prj2v, subscribe=True
             ),
             self._async_read_and_subscribe(
-                SERVICE3_UUID, CHARACTERISTIC_PRJ3V, _parse_prj3v, subscribe=True
+                CHARACTERISTIC_PRJ3V, self._parse_prj3v, subscribe=True
             ),
             self._async_read_and_subscribe(
-                SERVICE_UUID,
                 CHARACTERISTIC_CURRENT_AUTO_OFF_TIME,
-                _parse_current_auto_off_time,
+                self._parse_current_auto_off_time,
                 subscribe=True,
             ),
-            self._async_read_and_subscribe(
-                SERVICE_UUID,
-                CHARACTERISTIC_HEAT_HOURS_CHANGED,
-                _parse_heat_hours_changed,
-                subscribe=True,
-            ),
-            self._async_read_and_subscribe(
-                SERVICE_UUID,
-                CHARACTERISTIC_HEAT_MINUTES_CHANGED,
-                _parse_heat_minutes_changed,
-                subscribe=True,
-            ),
-            self._async_read_and_subscribe(
-                SERVICE_UUID,
-                CHARACTERISTIC_SHUT_OFF,
-                _parse_shut_off,
-                subscribe=False,
-            ),
-            self._async_read_and_subscribe(
-                SERVICE_UUID,
-                CHARACTERISTIC_LED_BRIGHTNESS,
-                _parse_led_brightness,
-                subscribe=False,
-            ),
+            return_exceptions=True,
+        )
+        self._log_read_errors(results)
+        self._after_data_updated()
+
+        fields = SETTING_FIELDS
+        if None in (getattr(self.data, field[1]) for field in IDENTIFIER_FIELDS):
+            fields += IDENTIFIER_FIELDS
+        results = await asyncio.gather(
+            *(self._async_read_field(field) for field in fields),
+            return_exceptions=True,
         )
+        self._log_read_errors(results)
         _LOGGER.debug("Initial characteristics read complete")
         self._after_data_updated()
         self._after_device_updated()
 
+    @staticmethod
+    def _log_read_errors(results: list[BaseException | None]) -> None:
+        """Log failed reads, so one characteristic cannot abort the others."""
+        for result in results:
+            if isinstance(result, BleakError):
+                _LOGGER.debug("Error reading characteristic: %s", result)
+            elif isinstance(result, BaseException):
+                raise result
+
     async def async_set_fan(self, on: bool) -> bool:
         """Set the fan on or off."""
         _LOGGER.debug("Setting fan to %s", on)
@@ -367,9 +484,8 @@ class VolcanoBLE(VolcanoHybridDataStatusProvider):
         # confirms it cannot race ahead and leave the write pending forever.
         self.data.fan_write = on
         written = await self._write_gatt(
-            SERVICE_UUID,
             CHARACTERISTIC_FAN_ON if on else CHARACTERISTIC_FAN_OFF,
-            bytearray([int(on)]),
+            PAYLOAD_ON if on else PAYLOAD_OFF,
         )
         self._after_data_updated()
         return written
@@ -381,9 +497,8 @@ class VolcanoBLE(VolcanoHybridDataStatusProvider):
         # confirms it cannot race ahead and leave the write pending forever.
         self.data.heater_write = on
         written = await self._write_gatt(
-            SERVICE_UUID,
             CHARACTERISTIC_HEATER_ON if on else CHARACTERISTIC_HEATER_OFF,
-            bytearray([int(on)]),
+            PAYLOAD_ON if on else PAYLOAD_OFF,
         )
         self._after_data_updated()
         return written
@@ -395,61 +510,48 @@ class VolcanoBLE(VolcanoHybridDataStatusProvider):
         # confirms it cannot race ahead and leave the write pending forever.
         self.data.set_temp_write = int(target)
         written = await self._write_gatt(
-            SERVICE_UUID,
-            CHARACTERISTIC_SET_TEMP,
-            bytearray(int.to_bytes(int(target * 10), 2, "little")),
+            CHARACTERISTIC_SET_TEMP, U16.pack(int(target * 10))
         )
-        if written:
-            await self._async_read_set_temp()
+        # The set temperature notification confirms the write
         self._after_data_updated()
         return written
 
     async def async_set_showing_celsius(self, on: bool) -> bool:
         """Set the toggle for showing Celsius."""
-        if on:
-            return await self._write_register_2(MASK_PRJSTAT2_VOLCANO_FAHRENHEIT_ENA)
-        return await self._write_register_2(
-            65536 + MASK_PRJSTAT2_VOLCANO_FAHRENHEIT_ENA
+        return await self._async_set_toggle(
+            CHARACTERISTIC_PRJ2V, SHOWING_CELSIUS_PAYLOADS, "showing_celsius", on
         )
 
     async def async_set_display_on_cooling(self, on: bool) -> bool:
         """Set the toggle for display on cooling."""
-        if on:
-            return await self._write_register_2(
-                MASK_PRJSTAT2_VOLCANO_DISPLAY_ON_COOLING
-            )
-        return await self._write_register_2(
-            65536 + MASK_PRJSTAT2_VOLCANO_DISPLAY_ON_COOLING
-        )
-
-    async def _write_register_2(self, mask: int) -> bool:
-        """Write to register 2."""
-        return await self._write_gatt(
-            SERVICE3_UUID,
-            CHARACTERISTIC_PRJ2V,
-            bytearray(int.to_bytes(mask, 4, "little")),
+        return await self._async_set_toggle(
+            CHARACTERISTIC_PRJ2V, DISPLAY_ON_COOLING_PAYLOADS, "display_on_cooling", on
         )
 
     async def async_set_vibration(self, on: bool) -> bool:
         """Set the toggle for vibration."""
-        if on:
-            return await self._write_register_3(MASK_PRJSTAT3_VOLCANO_VIBRATION)
-        return await self._write_register_3(65536 + MASK_PRJSTAT3_VOLCANO_VIBRATION)
-
-    async def _write_register_3(self, mask: int) -> bool:
-        """Write to register 3."""
-        return await self._write_gatt(
-            SERVICE3_UUID,
-            CHARACTERISTIC_PRJ3V,
-            bytearray(int.to_bytes(mask, 4, "little")),
+        return await self._async_set_toggle(
+            CHARACTERISTIC_PRJ3V, VIBRATION_PAYLOADS, "vibration", on
         )
 
+    async def _async_set_toggle(
+        self,
+        characteristic: str,
+        payloads: tuple[bytes, bytes],
+        attr: str,
+        on: bool,
+    ) -> bool:
+        """Write a settings toggle to its status register."""
+        written = await self._write_gatt(characteristic, payloads[on])
+        if written:
+            setattr(self.data, attr, on)
+            self._after_data_updated()
+        return written
+
     async def async_set_shut_off(self, minutes: int) -> bool:
         """Set the shut off time in minutes."""
         written = await self._write_gatt(
-            SERVICE_UUID,
-            CHARACTERISTIC_SHUT_OFF,
-            bytearray(int.to_bytes(minutes * 60, 2, "little")),
+            CHARACTERISTIC_SHUT_OFF, U16.pack(minutes * 60)
         )
         if written:
             self.data.shut_off = minutes
@@ -459,9 +561,7 @@ class VolcanoBLE(VolcanoHybridDataStatusProvider):
     async def async_set_led_brightness(self, brightness: int) -> bool:
         """Set the LED brightness."""
         written = await self._write_gatt(
-            SERVICE_UUID,
-            CHARACTERISTIC_LED_BRIGHTNESS,
-            bytearray(int.to_bytes(brightness, 2, "little")),
+            CHARACTERISTIC_LED_BRIGHTNESS, U16.pack(brightness)
         )
         if written:
             self.data.led_brightness = brightness
@@ -470,29 +570,34 @@ class VolcanoBLE(VolcanoHybridDataStatusProvider):
 
     async def async_disconnect(self) -> None:
         """Disconnect from the Volcano device."""
+        self._cancel_ensure_written_values()
         if self.client:
             if self.client.is_connected:
                 await self.client.disconnect()
             self.client = None
+            self._characteristics.clear()
+            self._last_values.clear()
+            self._subscribed.clear()
             self._after_data_updated()
 
-    @staticmethod
     def _get_characteristic(
-        client: BleakClient, service_uuid: str, characteristic: str
+        self, client: BleakClient, characteristic: str
     ) -> BleakGATTCharacteristic:
         """Resolve a characteristic, raising BleakError when it is missing."""
-        service = client.services.get_service(service_uuid)
+        if (char := self._characteristics.get(characteristic)) is not None:
+            return char
+        service = client.services.get_service(CHARACTERISTIC_SERVICES[characteristic])
         char = service.get_characteristic(characteristic) if service else None
         if char is None:
             msg = f"Characteristic {characteristic} not found"
             raise BleakError(msg)
+        self._characteristics[characteristic] = char
         return char
 
     async def _async_read_and_subscribe(
         self,
-        service_uuid: str,
         characteristic: str,
-        value_change_callback: Callable[[bytearray], Awaitable[None] | None],
+        value_change_callback: Callable[[bytearray], None],
         subscribe: bool,
     ) -> None:
         """Read a characteristic from the BLE device."""
@@ -500,41 +605,73 @@ class VolcanoBLE(VolcanoHybridDataStatusProvider):
         if client is None or not client.is_connected:
             return
 
-        async def _async_call_callback(data: bytearray) -> None:
-            result = value_change_callback(data)
-            if inspect.isawaitable(result):
-                await result
+        char = self._get_characteristic(client, characteristic)
+        # The subscription is queued alongside the read instead of after it
+        notify = (
+            asyncio.create_task(
+                self._async_start_notify(
+                    client, char, characteristic, value_change_callback
+                )
+            )
+            if subscribe
+            else None
+        )
+        try:
+            current_value = await client.read_gatt_char(char)
+        finally:
+            if notify is not None:
+                await notify
 
-        char = self._get_characteristic(client, service_uuid, characteristic)
-        current_value = await client.read_gatt_char(char)
-        if (
-            subscribe and client.is_connected
-        ):  # We just awaited a read, we could be disconnected now
-            try:
+        self._last_values[characteristic] = bytearray(current_value)
+        value_change_callback(current_value)
+
+    async def _async_start_notify(
+        self,
+        client: BleakClient,
+        char: BleakGATTCharacteristic,
+        characteristic: str,
+        value_change_callback: Callable[[bytearray], None],
+    ) -> None:
+        """Follow a characteristic, disconnecting when that fails."""
 
-                async def _async_callback(
-                    _: BleakGATTCharacteristic, data: bytearray
-                ) -> None:
-                    await _async_call_callback(data)
-                    self._after_data_updated()
+        # A plain callback, bleak runs it inline instead of spawning a task
+        def _callback(_: BleakGATTCharacteristic, data: bytearray) -> None:
+            if self._is_repeated_value(characteristic, data):
+                return
+            value_change_callback(data)
+            self._after_data_updated()
 
-                await client.start_notify(char, _async_callback)
-            except BleakError:
-                await self.async_disconnect()
+        try:
+            await client.start_notify(char, _callback)
+        except BleakError:
+            await self.async_disconnect()
+        else:
+            if client is self.client:
+                self._subscribed.add(characteristic)
 
-        await _async_call_callback(current_value)
+    def _is_repeated_value(self, characteristic: str, data: bytearray) -> bool:
+        """Check if the payload was already applied, recording it when it was not."""
+        if self._last_values.get(characteristic) == data:
+            return True
+        self._last_values[characteristic] = bytearray(data)
+        return False
 
-    async def _write_gatt(
-        self,
-        service_uuid: str,
-        characteristic: str,
-        value: bytearray,
-    ) -> bool:
+    async def _write_gatt(self, characteristic: str, value: bytes | bytearray) -> bool:
         """Write to the GATT characteristic, returns whether it was written."""
-        if not await self._ensure_client_connected() or (client := self.client) is None:
-            return False
+        # Only take the connect lock when the client is actually gone
+        client = self.client
+        if client is None or not client.is_connected:
+            if not await self._ensure_client_connected():
+                return False
+            if (client := self.client) is None:
+                return False
 
-        char = self._get_characteristic(client, service_uuid, characteristic)
+        char = self._get_characteristic(client, characteristic)
+        # Writing can change the state behind the last payload of the
+        # characteristic reporting it, so its next notification is applied again.
+        self._last_values.pop(
+            STATUS_CHARACTERISTICS.get(characteristic, characteristic), None
+        )
         await client.write_gatt_char(
             char,
             value,
@@ -543,8 +680,12 @@ class VolcanoBLE(VolcanoHybridDataStatusProvider):
 
     async def _async_try_ensure_written_values(self) -> None:
         """Ensure that the pending writes are written to the device."""
-        await self._async_read_set_temp()
-        await self._async_read_prj1v()
+        if self.data.set_temp_write is not None:
+            # Only a pending write needs a fresh value, notifications keep it
+            await self._async_read_set_temp()
+        if CHARACTERISTIC_PRJ1V not in self._subscribed:
+            # A live subscription already keeps the on state current
+            await self._async_read_prj1v()
         if (
             self.data.fan_needs_write
             or self.data.heater_needs_write
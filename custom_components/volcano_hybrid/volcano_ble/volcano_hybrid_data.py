@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from typing import Any
-
 from .const import VOLCANO_HYBRID_MAX_TEMP, VOLCANO_HYBRID_MIN_TEMP
 
 
@@ -29,6 +27,34 @@ class VolcanoHybridDataStatusProvider:
 class VolcanoHybridData:
     """Data object to hold Volcano Hybrid data."""
 
+    # Read by every entity on every update; slots keep those reads cheap.
+    __slots__ = (
+        "_current_temp",
+        "_fan",
+        "_fan_write",
+        "_heater",
+        "_heater_write",
+        "_set_temp",
+        "_set_temp_write",
+        "auto_shutdown",
+        "bootloader_version",
+        "current_auto_off_time",
+        "device",
+        "display_on_cooling",
+        "firmware",
+        "firmware_ble_version",
+        "firmware_version",
+        "heat_hours_changed",
+        "heat_minutes_changed",
+        "led_brightness",
+        "prv1_error",
+        "prv2_error",
+        "serial_number",
+        "showing_celsius",
+        "shut_off",
+        "vibration",
+    )
+
     def __init__(self, device: VolcanoHybridDataStatusProvider) -> None:
         """Initialize the Volcano Hybrid data object."""
         self.device = device
@@ -40,7 +66,8 @@ class VolcanoHybridData:
         self.firmware_ble_version: str | None = None
         self.bootloader_version: str | None = None
         self.firmware: str | None = None
-        self._current_auto_off_time: float | None = None
+        # Minutes until auto off, None while the device is off
+        self.current_auto_off_time: float | None = None
         self.heat_hours_changed: int | None = None
         self.heat_minutes_changed: int | None = None
         self.shut_off: int | None = None
@@ -215,17 +242,6 @@ class VolcanoHybridData:
             return None
         return self.heat_hours_changed * 60 + self.heat_minutes_changed
 
-    @property
-    def current_auto_off_time(self) -> float | None:
-        """Get the current auto off time in minutes."""
-        if self._current_auto_off_time and self._current_auto_off_time > 0:
-            return self._current_auto_off_time
-        return None
-
-    @current_auto_off_time.setter
-    def current_auto_off_time(self, value: float) -> None:
-        self._current_auto_off_time = value
-
     @property
     def current_on_time(self) -> float | None:
         """Get the current on time in minutes."""
@@ -246,7 +262,3 @@ class VolcanoHybridData:
             self._current_temp = value
         else:
             self._current_temp = None
-
-    def get(self, key: str) -> Any | None:
-        """Get the value of the specified key."""
-        return getattr(self, key)
@@ -106,6 +106,13 @@ class FakeVolcanoBLE(VolcanoHybridDataStatusProvider):
         """Get the device rssi."""
         return self.device_rssi
 
+    @rssi.setter
+    def rssi(self, value: int) -> None:
+        """Set the device rssi, notifying the coordinator when it changed."""
+        if self.device_rssi != value:
+            self.device_rssi = value
+            self.data_updated()
+
     @property
     def is_connected(self) -> bool:
         """Determine whether the device is connected."""
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import zlib
 from datetime import timedelta
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
+from habluetooth import get_manager
+from homeassistant.helpers import device_registry as dr
 from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
-from . import FakeVolcanoBLE, make_ble_device, make_service_info
+from custom_components.volcano_hybrid.const import DOMAIN
+from custom_components.volcano_hybrid.coordinator import (
+    IDLE_UPDATE_INTERVAL,
+    UPDATE_INTERVAL,
+)
+from custom_components.volcano_hybrid.volcano_ble import VolcanoHybridData
+
+from . import VOLCANO_ADDRESS, FakeVolcanoBLE, make_ble_device, make_service_info
 
 if TYPE_CHECKING:
+    from bleak.backends.device import BLEDevice
     from homeassistant.core import HomeAssistant
     from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -45,6 +57,31 @@ async def test_enable_debounces_scheduled_connect(
         assert mock_volcano.manual_update_count >= 1
 
 
+async def test_advertisement_burst_connects_once(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_volcano: FakeVolcanoBLE,
+) -> None:
+    """A burst of advertisements results in a single connect attempt."""
+    coordinator = init_integration.runtime_data
+    start = dt_util.utcnow()
+
+    with (
+        patch(_DEVICE_PATCH, return_value=make_ble_device()),
+        patch(_INFO_PATCH, return_value=make_service_info()),
+    ):
+        # Changing advertisement data, so every one reaches the coordinator
+        for serial in range(5):
+            get_manager().scanner_adv_received(
+                make_service_info(name=f"S&B VOLCANO H {serial}")
+            )
+        async_fire_time_changed(
+            hass, start + timedelta(seconds=coordinator.auto_connect_delay + 1)
+        )
+        await hass.async_block_till_done()
+        assert mock_volcano.manual_update_count == 1
+
+
 async def test_scheduled_connect_skipped_when_already_connected(
     hass: HomeAssistant,
     init_integration: MockConfigEntry,
@@ -68,3 +105,191 @@ async def test_scheduled_connect_skipped_when_already_connected(
         await hass.async_block_till_done()
 
         assert mock_volcano.manual_update_count == 0
+
+
+async def test_update_interval_follows_activity(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_volcano: FakeVolcanoBLE,
+) -> None:
+    """The fallback poll backs off while connected to an idle device."""
+    coordinator = init_integration.runtime_data
+    assert coordinator.update_interval == UPDATE_INTERVAL
+
+    mock_volcano.connected = True
+    mock_volcano.data.fan = False
+    mock_volcano.data.heater = False
+    mock_volcano.data_updated()
+    await hass.async_block_till_done()
+    assert coordinator.update_interval == IDLE_UPDATE_INTERVAL
+
+    # An unconfirmed write keeps the fast poll so it is replayed promptly
+    mock_volcano.data.heater_write = True
+    mock_volcano.data_updated()
+    await hass.async_block_till_done()
+    assert coordinator.update_interval == UPDATE_INTERVAL
+
+    mock_volcano.data.heater = True
+    mock_volcano.data_updated()
+    await hass.async_block_till_done()
+    assert coordinator.update_interval == UPDATE_INTERVAL
+
+    mock_volcano.data.heater = False
+    mock_volcano.connected = False
+    mock_volcano.data_updated()
+    await hass.async_block_till_done()
+    assert coordinator.update_interval == UPDATE_INTERVAL
+
+
+async def test_first_poll_is_staggered(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_volcano: FakeVolcanoBLE,
+) -> None:
+    """The first poll is offset per device, later polls use the interval."""
+    stagger = timedelta(seconds=zlib.crc32(VOLCANO_ADDRESS.encode()) % 10)
+    # The scheduler rounds to whole seconds
+    margin = timedelta(seconds=2)
+
+    with (
+        patch(_DEVICE_PATCH, return_value=make_ble_device()),
+        patch(_INFO_PATCH, return_value=make_service_info()),
+    ):
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + UPDATE_INTERVAL + stagger - margin
+        )
+        await hass.async_block_till_done()
+        assert mock_volcano.manual_update_count == 0
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + UPDATE_INTERVAL + stagger + margin
+        )
+        await hass.async_block_till_done()
+        assert mock_volcano.manual_update_count == 1
+
+        async_fire_time_changed(hass, dt_util.utcnow() + UPDATE_INTERVAL + margin)
+        await hass.async_block_till_done()
+        assert mock_volcano.manual_update_count == 2
+
+
+async def test_device_registry_entry_resolved_once(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_volcano: FakeVolcanoBLE,
+) -> None:
+    """The registry device is looked up once, later updates reuse its id."""
+    dev_reg = dr.async_get(hass)
+
+    with patch.object(
+        dev_reg, "async_get_device", wraps=dev_reg.async_get_device
+    ) as get_device:
+        mock_volcano.data.serial_number = "VH123456"
+        mock_volcano.device_updated()
+        mock_volcano.data.firmware_version = "V01.23"
+        mock_volcano.device_updated()
+
+    assert get_device.call_count == 1
+    device = dev_reg.async_get_device(identifiers={(DOMAIN, VOLCANO_ADDRESS)})
+    assert device is not None
+    assert device.serial_number == "VH123456"
+    assert device.sw_version == "V01.23"
+
+
+async def test_poll_skipped_while_refresh_runs(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_volcano: FakeVolcanoBLE,
+) -> None:
+    """A poll during a running device refresh does not refresh it again."""
+    coordinator = init_integration.runtime_data
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _slow_update(_device: BLEDevice) -> VolcanoHybridData:
+        started.set()
+        await release.wait()
+        return mock_volcano.data
+
+    with (
+        patch(_DEVICE_PATCH, return_value=make_ble_device()),
+        patch(_INFO_PATCH, return_value=make_service_info()),
+        patch.object(
+            mock_volcano, "async_manual_update", side_effect=_slow_update
+        ) as manual_update,
+    ):
+        reconnect = hass.async_create_task(coordinator.reconnect())
+        await started.wait()
+
+        try:
+            # The poll returns right away instead of waiting for the refresh
+            async with asyncio.timeout(1):
+                await coordinator.async_refresh()
+        finally:
+            release.set()
+            await reconnect
+
+    assert manual_update.await_count == 1
+
+
+async def test_unload_stops_polling(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_volcano: FakeVolcanoBLE,
+) -> None:
+    """A poll scheduled after the entry is unloaded never reaches the device."""
+    coordinator = init_integration.runtime_data
+    await hass.config_entries.async_unload(init_integration.entry_id)
+    await hass.async_block_till_done()
+
+    with (
+        patch(_DEVICE_PATCH, return_value=make_ble_device()),
+        patch(_INFO_PATCH, return_value=make_service_info()),
+    ):
+        coordinator._schedule_refresh()  # noqa: SLF001
+        async_fire_time_changed(hass, dt_util.utcnow() + UPDATE_INTERVAL * 2)
+        await hass.async_block_till_done()
+
+    assert mock_volcano.manual_update_count == 0
+
+
+async def test_unload_leaves_no_listener_update(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_volcano: FakeVolcanoBLE,
+) -> None:
+    """The update reported by the final disconnect does not run after unload."""
+    coordinator = init_integration.runtime_data
+
+    async def _disconnect() -> None:
+        mock_volcano.connected = False
+        mock_volcano.data_updated()
+
+    with (
+        patch.object(mock_volcano, "async_disconnect", side_effect=_disconnect),
+        patch.object(coordinator, "async_update_listeners") as update_listeners,
+    ):
+        await hass.config_entries.async_unload(init_integration.entry_id)
+        await hass.async_block_till_done()
+
+    update_listeners.assert_not_called()
+
+
+async def test_device_updates_are_coalesced(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_volcano: FakeVolcanoBLE,
+) -> None:
+    """A burst of device updates results in a single listener update."""
+    coordinator = init_integration.runtime_data
+    updates: list[None] = []
+    remove_listener = coordinator.async_add_listener(lambda: updates.append(None))
+
+    mock_volcano.connected = True
+    for temp in range(180, 185):
+        mock_volcano.data.current_temp = temp
+        mock_volcano.data_updated()
+    assert not updates
+
+    await hass.async_block_till_done()
+    assert len(updates) == 1
+    remove_listener()
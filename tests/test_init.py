@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
+import pytest
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_ON, STATE_UNAVAILABLE
 from homeassistant.helpers import device_registry as dr
 
 from custom_components.volcano_hybrid import async_remove_config_entry_device
+from custom_components.volcano_hybrid.climate import VolcanoHybridClimate
 from custom_components.volcano_hybrid.const import DOMAIN
 
 from . import VOLCANO_ADDRESS, FakeVolcanoBLE, get_entity_id
@@ -36,6 +40,48 @@ async def test_setup_and_unload_entry(
     assert mock_volcano.disconnect_count == 1
 
 
+@pytest.mark.parametrize(
+    ("platform", "key"),
+    [
+        ("climate", "volcano"),
+        ("binary_sensor", "auto_shutdown"),
+        ("number", "shut_off"),
+        ("sensor", "current_auto_off_time"),
+        ("switch", "vibration"),
+    ],
+)
+async def test_entities_unavailable_until_connected(
+    hass: HomeAssistant,
+    entity_registry_enabled_by_default: None,
+    init_integration: MockConfigEntry,
+    mock_volcano: FakeVolcanoBLE,
+    platform: str,
+    key: str,
+) -> None:
+    """Device entities are unavailable before the first connect and after it."""
+    entity_id = get_entity_id(hass, platform, key)
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == STATE_UNAVAILABLE
+    connected = hass.states.get(get_entity_id(hass, "binary_sensor", "connected"))
+    assert connected is not None
+    assert connected.state != STATE_UNAVAILABLE
+
+    mock_volcano.connected = True
+    mock_volcano.data_updated()
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state != STATE_UNAVAILABLE
+
+    mock_volcano.connected = False
+    mock_volcano.data_updated()
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == STATE_UNAVAILABLE
+
+
 async def test_device_registry_info(
     hass: HomeAssistant,
     init_integration: MockConfigEntry,
@@ -79,3 +125,23 @@ async def test_remove_config_entry_device(
         identifiers={(DOMAIN, OTHER_ADDRESS)},
     )
     assert await async_remove_config_entry_device(hass, entry, stale)
+
+
+async def test_failing_entity_does_not_block_others(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_volcano: FakeVolcanoBLE,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """An entity failing to handle an update does not stall the others."""
+    with patch.object(
+        VolcanoHybridClimate, "_async_update_attrs", side_effect=ValueError("boom")
+    ):
+        mock_volcano.connected = True
+        mock_volcano.data_updated()
+        await hass.async_block_till_done()
+
+    assert "Error handling an update" in caplog.text
+    state = hass.states.get(get_entity_id(hass, "binary_sensor", "connected"))
+    assert state is not None
+    assert state.state == STATE_ON
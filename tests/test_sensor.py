@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 from homeassistant.const import STATE_UNAVAILABLE
 
+from custom_components.volcano_hybrid.sensor import VolcanoSensorEntity
+
 from . import FakeVolcanoBLE, get_entity_id
 
 if TYPE_CHECKING:
@@ -79,3 +82,28 @@ async def test_sensor_availability(
     auto_off = hass.states.get(auto_off_id)
     assert auto_off is not None
     assert auto_off.state != STATE_UNAVAILABLE
+
+
+async def test_sensor_skips_unchanged_writes(
+    hass: HomeAssistant,
+    entity_registry_enabled_by_default: None,
+    init_integration: MockConfigEntry,
+    mock_volcano: FakeVolcanoBLE,
+) -> None:
+    """Sensors only write their state when the value or availability changed."""
+    mock_volcano.connected = True
+    mock_volcano.data.shut_off = 30
+    mock_volcano.data.current_auto_off_time = 20.0
+    mock_volcano.data_updated()
+    await hass.async_block_till_done()
+
+    with patch.object(VolcanoSensorEntity, "async_write_ha_state") as write_state:
+        mock_volcano.data_updated()
+        await hass.async_block_till_done()
+        write_state.assert_not_called()
+
+        mock_volcano.data.current_auto_off_time = 19.0
+        mock_volcano.data_updated()
+        await hass.async_block_till_done()
+        # Both the auto off and the derived on time changed
+        assert write_state.call_count == 2
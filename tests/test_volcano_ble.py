@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from bleak import BleakError
 from bleak_retry_connector import BleakNotFoundError
 
 from custom_components.volcano_hybrid.volcano_ble.volcano_ble import (
@@ -65,8 +67,13 @@ class FakeService:
 class FakeServices:
     """A GATT service collection."""
 
+    def __init__(self) -> None:
+        """Initialize the collection."""
+        self.lookups = 0
+
     def get_service(self, uuid: str) -> FakeService:
         """Get a service by uuid."""
+        self.lookups += 1
         return FakeService()
 
 
@@ -76,6 +83,7 @@ class FakeBleakClient:
     def __init__(self, values: dict[str, bytes]) -> None:
         """Initialize the client."""
         self.values = values
+        self.reads: list[str] = []
         self.written: list[tuple[str, bytes]] = []
         self.notify_callbacks: dict[str, Callable[..., Any]] = {}
         self.is_connected = True
@@ -84,6 +92,7 @@ class FakeBleakClient:
 
     async def read_gatt_char(self, char: FakeCharacteristic) -> bytearray:
         """Read a characteristic."""
+        self.reads.append(char.uuid)
         return bytearray(self.values[char.uuid])
 
     async def write_gatt_char(self, char: FakeCharacteristic, value: bytearray) -> None:
@@ -96,6 +105,13 @@ class FakeBleakClient:
         """Record a notification subscription."""
         self.notify_callbacks[char.uuid] = callback
 
+    async def notify(self, characteristic: str, value: bytes) -> None:
+        """Push a notification for a characteristic, updating its value."""
+        self.values[characteristic] = value
+        self.notify_callbacks[characteristic](
+            FakeCharacteristic(characteristic), bytearray(value)
+        )
+
     async def disconnect(self) -> None:
         """Disconnect the client."""
         self.is_connected = False
@@ -176,22 +192,109 @@ async def test_connect_reads_state() -> None:
     assert CHARACTERISTIC_PRJ1V in client.notify_callbacks
 
 
+async def test_reconnect_skips_device_identifiers() -> None:
+    """The device identifiers are only read on the first connection."""
+    client = FakeBleakClient(default_values())
+    volcano, _, _ = await connect(client)
+    assert CHARACTERISTIC_SERIAL_NUMBER in client.reads
+
+    volcano._disconnected(client)  # noqa: SLF001
+    new_client = FakeBleakClient(default_values())
+    with patch(ESTABLISH_CONNECTION, AsyncMock(return_value=new_client)):
+        await volcano.async_manual_update(make_ble_device())
+
+    assert CHARACTERISTIC_CURRENT_TEMP in new_client.reads
+    assert CHARACTERISTIC_SERIAL_NUMBER not in new_client.reads
+    assert volcano.data.serial_number == "VH123456"
+
+
+async def test_live_state_read_before_settings() -> None:
+    """The subscribed state is read before the settings and identifiers."""
+    client = FakeBleakClient(default_values())
+    await connect(client)
+
+    first_setting = client.reads.index(CHARACTERISTIC_SHUT_OFF)
+    for uuid in client.notify_callbacks:
+        assert client.reads.index(uuid) < first_setting
+    assert client.reads.index(CHARACTERISTIC_SERIAL_NUMBER) > first_setting
+
+
+async def test_failed_read_does_not_abort_others() -> None:
+    """A characteristic that fails to read leaves the others readable."""
+
+    class FailingClient(FakeBleakClient):
+        async def read_gatt_char(self, char: FakeCharacteristic) -> bytearray:
+            if char.uuid == CHARACTERISTIC_SERIAL_NUMBER:
+                msg = "read failed"
+                raise BleakError(msg)
+            return await super().read_gatt_char(char)
+
+    client = FailingClient(default_values())
+    volcano, _, device_updates = await connect(client)
+
+    assert volcano.data.serial_number is None
+    assert volcano.data.firmware_version == "V01.23"
+    assert volcano.data.led_brightness == 70
+    assert device_updates
+
+
+async def test_short_status_payload_is_decoded() -> None:
+    """A status register shorter than two bytes does not abort the connect."""
+    values = default_values()
+    values[CHARACTERISTIC_PRJ1V] = bytes([MASK_PRJSTAT1_VOLCANO_HEIZUNG_ENA])
+    client = FakeBleakClient(values)
+    volcano, _, _ = await connect(client)
+
+    assert volcano.data.heater is True
+    assert volcano.data.fan is False
+    assert volcano.data.serial_number == "VH123456"
+
+    await client.notify(CHARACTERISTIC_PRJ1V, b"\x00")
+    assert volcano.data.heater is False
+
+
 async def test_notifications_update_data() -> None:
     """Device notifications update the data and notify the listener."""
     client = FakeBleakClient(default_values())
     volcano, data_updates, _ = await connect(client)
     data_updates.clear()
 
+    # Plain parsers are handed to bleak as plain callbacks, run inline
     callback = client.notify_callbacks[CHARACTERISTIC_CURRENT_TEMP]
-    await callback(
-        FakeCharacteristic(CHARACTERISTIC_CURRENT_TEMP),
-        bytearray((2000).to_bytes(2, "little")),
-    )
+    assert not inspect.iscoroutinefunction(callback)
+    await client.notify(CHARACTERISTIC_CURRENT_TEMP, (2000).to_bytes(2, "little"))
 
     assert volcano.data.current_temp == 200
     assert data_updates
 
 
+async def test_repeated_notifications_are_dropped() -> None:
+    """A notification repeating the last payload does not update the data."""
+    client = FakeBleakClient(default_values())
+    volcano, data_updates, _ = await connect(client)
+    data_updates.clear()
+
+    # Same payload as the initial read
+    await client.notify(CHARACTERISTIC_CURRENT_TEMP, (1850).to_bytes(2, "little"))
+    assert not data_updates
+
+    await client.notify(CHARACTERISTIC_CURRENT_TEMP, (1860).to_bytes(2, "little"))
+    await client.notify(CHARACTERISTIC_CURRENT_TEMP, (1860).to_bytes(2, "little"))
+    assert len(data_updates) == 1
+    assert volcano.data.current_temp == 186
+
+
+async def test_auto_off_time_cleared_when_off() -> None:
+    """An auto off time of 0 means the device is off."""
+    client = FakeBleakClient(default_values())
+    volcano, _, _ = await connect(client)
+
+    await client.notify(CHARACTERISTIC_CURRENT_AUTO_OFF_TIME, (0).to_bytes(2, "little"))
+
+    assert volcano.data.current_auto_off_time is None
+    assert volcano.data.current_on_time is None
+
+
 async def test_set_fan_and_heater() -> None:
     """Fan and heater commands write the matching characteristics."""
     client = FakeBleakClient(default_values())
@@ -204,20 +307,59 @@ async def test_set_fan_and_heater() -> None:
     assert (CHARACTERISTIC_HEATER_OFF, b"\x00") in client.written
 
 
+async def test_status_notification_applied_after_toggle() -> None:
+    """A status echo after a fan or heater write is not dropped as repeated."""
+    client = FakeBleakClient(default_values())
+    volcano, data_updates, _ = await connect(client)
+    data_updates.clear()
+
+    assert await volcano.async_set_heater(True)
+    data_updates.clear()
+
+    # The device echoes its status, which matches the payload read on connect
+    await client.notify(CHARACTERISTIC_PRJ1V, client.values[CHARACTERISTIC_PRJ1V])
+
+    assert data_updates
+
+
 async def test_set_target_temperature() -> None:
-    """The target temperature is written and read back."""
+    """The target temperature is written and confirmed by notification."""
     client = FakeBleakClient(default_values())
     volcano, _, _ = await connect(client)
+    reads = len(client.reads)
 
-    client.values[CHARACTERISTIC_SET_TEMP] = (1950).to_bytes(2, "little")
     assert await volcano.async_set_target_temperature(195)
 
     assert (CHARACTERISTIC_SET_TEMP, (1950).to_bytes(2, "little")) in client.written
-    assert volcano.data.set_temp == 195
+    # No read back, the notification confirms the write
+    assert CHARACTERISTIC_SET_TEMP not in client.reads[reads:]
+    assert volcano.data.set_temp == 190
     assert volcano.data.set_temp_state == 195
+    assert volcano.data.is_assumed
+
+    await client.notify(CHARACTERISTIC_SET_TEMP, (1950).to_bytes(2, "little"))
+    assert volcano.data.set_temp == 195
     assert not volcano.data.is_assumed
 
 
+async def test_characteristics_resolved_once_per_connection() -> None:
+    """Characteristics are looked up once per connection and then reused."""
+    client = FakeBleakClient(default_values())
+    volcano, _, _ = await connect(client)
+
+    assert await volcano.async_set_fan(True)
+    lookups = client.services.lookups
+    assert await volcano.async_set_fan(True)
+    assert client.services.lookups == lookups
+
+    volcano._disconnected(client)  # noqa: SLF001
+    new_client = FakeBleakClient(default_values())
+    with patch(ESTABLISH_CONNECTION, AsyncMock(return_value=new_client)):
+        assert await volcano.async_set_fan(True)
+    # A new connection resolves against its own services
+    assert new_client.services.lookups
+
+
 async def test_settings_writes() -> None:
     """Setting writes use the documented encodings."""
     client = FakeBleakClient(default_values())
@@ -242,6 +384,8 @@ async def test_settings_writes() -> None:
         CHARACTERISTIC_PRJ2V,
         (65536 + MASK_PRJSTAT2_VOLCANO_FAHRENHEIT_ENA).to_bytes(4, "little"),
     ) in client.written
+    # Reflected right away, without waiting for the status notification
+    assert volcano.data.showing_celsius is False
 
     assert await volcano.async_set_display_on_cooling(True)
     assert (
@@ -254,6 +398,7 @@ async def test_settings_writes() -> None:
         CHARACTERISTIC_PRJ3V,
         (65536 + MASK_PRJSTAT3_VOLCANO_VIBRATION).to_bytes(4, "little"),
     ) in client.written
+    assert volcano.data.vibration is False
 
 
 async def test_pending_writes_dropped_when_device_off() -> None:
@@ -288,6 +433,85 @@ async def test_pending_writes_replayed_when_device_on() -> None:
     assert (CHARACTERISTIC_HEATER_ON, b"\x01") in client.written
 
 
+async def test_pending_writes_replayed_after_notification() -> None:
+    """An auto-off notification replays pending writes outside its handler."""
+    values = default_values()
+    # Fan on, heater off
+    values[CHARACTERISTIC_PRJ1V] = MASK_PRJSTAT1_VOLCANO_PUMPE_FET_ENABLE.to_bytes(
+        2, "little"
+    )
+    client = FakeBleakClient(values)
+    volcano, _, _ = await connect(client)
+
+    volcano.data.heater_write = True
+    await client.notify(
+        CHARACTERISTIC_CURRENT_AUTO_OFF_TIME, (600).to_bytes(2, "little")
+    )
+    assert (CHARACTERISTIC_HEATER_ON, b"\x01") not in client.written
+
+    task = volcano._ensure_written_task  # noqa: SLF001
+    assert task is not None
+    await task
+    assert (CHARACTERISTIC_HEATER_ON, b"\x01") in client.written
+
+
+async def test_update_waits_for_notification_replay() -> None:
+    """An update does not send the writes a notification is replaying again."""
+    values = default_values()
+    # Fan on, heater off
+    values[CHARACTERISTIC_PRJ1V] = MASK_PRJSTAT1_VOLCANO_PUMPE_FET_ENABLE.to_bytes(
+        2, "little"
+    )
+    client = FakeBleakClient(values)
+    volcano, _, _ = await connect(client)
+
+    volcano.data.heater_write = True
+    await client.notify(
+        CHARACTERISTIC_CURRENT_AUTO_OFF_TIME, (600).to_bytes(2, "little")
+    )
+    assert volcano.device is not None
+    await volcano.async_manual_update(volcano.device)
+
+    assert client.written.count((CHARACTERISTIC_HEATER_ON, b"\x01")) == 1
+
+
+async def test_disconnect_cancels_notification_replay() -> None:
+    """A replay still pending on disconnect does not reconnect the device."""
+    values = default_values()
+    # Fan on, heater off
+    values[CHARACTERISTIC_PRJ1V] = MASK_PRJSTAT1_VOLCANO_PUMPE_FET_ENABLE.to_bytes(
+        2, "little"
+    )
+    client = FakeBleakClient(values)
+    volcano, _, _ = await connect(client)
+
+    volcano.data.heater_write = True
+    await client.notify(
+        CHARACTERISTIC_CURRENT_AUTO_OFF_TIME, (600).to_bytes(2, "little")
+    )
+    task = volcano._ensure_written_task  # noqa: SLF001
+    assert task is not None
+    await volcano.async_disconnect()
+    await asyncio.wait((task,))
+
+    assert task.cancelled()
+    assert volcano.client is None
+    assert (CHARACTERISTIC_HEATER_ON, b"\x01") not in client.written
+
+
+async def test_update_relies_on_live_status_subscription() -> None:
+    """The update cycle does not re-read the subscribed on/off status."""
+    client = FakeBleakClient(default_values())
+    volcano, _, _ = await connect(client)
+
+    client.reads.clear()
+    volcano.data.heater_write = True
+    assert volcano.device is not None
+    await volcano.async_manual_update(volcano.device)
+
+    assert CHARACTERISTIC_PRJ1V not in client.reads
+
+
 class ConfirmingClient(FakeBleakClient):
     """
     A client that confirms heater writes before the write call returns.
@@ -305,13 +529,6 @@ class ConfirmingClient(FakeBleakClient):
                 prj1v |= MASK_PRJSTAT1_VOLCANO_HEIZUNG_ENA
             await self.notify(CHARACTERISTIC_PRJ1V, prj1v.to_bytes(2, "little"))
 
-    async def notify(self, characteristic: str, value: bytes) -> None:
-        """Push a notification for a characteristic, updating its value."""
-        self.values[characteristic] = value
-        await self.notify_callbacks[characteristic](
-            FakeCharacteristic(characteristic), bytearray(value)
-        )
-
 
 async def test_physical_turn_on_is_not_reverted() -> None:
     """